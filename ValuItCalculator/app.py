@@ -1,8 +1,5 @@
 import streamlit as st
-import os
-import pandas as pd
-from datetime import datetime
-from pages import home, valuation_tool, my_valuations, professional_mode, learn, company_info, about, faq
+import pages
 
 # Set page configuration
 st.set_page_config(
@@ -78,7 +75,8 @@ def sidebar():
     # Navigation options
     nav_selection = st.sidebar.radio(
         "Navigation",
-        ["Home", "Valuation Tool", "My Valuations", "Professional Mode", "Learn", "Company Info", "FAQ", "About"]
+        ["Home", "Valuation Tool", "My Valuations", "Professional Mode", "Learn", "Company Info", "FAQ", "About"],
+        key="nav_selection"
     )
     
     # Credit at the bottom of sidebar
@@ -93,29 +91,29 @@ def main():
     
     # Route to the appropriate page based on navigation selection
     if nav_selection == "Home":
-        home()
+        pages.home()
     elif nav_selection == "Valuation Tool":
-        valuation_tool(pro_mode=st.session_state.pro_mode)
+        pages.valuation_tool(pro_mode=st.session_state.pro_mode)
     elif nav_selection == "My Valuations":
         if st.session_state.user:
-            my_valuations()
+            pages.my_valuations()
         else:
             st.warning("Please login to access your saved valuations.")
-            home()
+            pages.home()
     elif nav_selection == "Professional Mode":
         if st.session_state.user and st.session_state.pro_mode:
-            professional_mode()
+            pages.professional_mode()
         else:
             st.warning("Professional Mode requires login and activation.")
-            home()
+            pages.home()
     elif nav_selection == "Learn":
-        learn()
+        pages.learn()
     elif nav_selection == "Company Info":
-        company_info()
+        pages.company_info()
     elif nav_selection == "FAQ":
-        faq()
+        pages.faq()
     elif nav_selection == "About":
-        about()
+        pages.about()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,92 @@
+import copy
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+# Maximum number of valuation results kept in memory
+MAX_CACHED_VALUATIONS = 128
+
+_results = OrderedDict()
+_lock = threading.Lock()
+
+
+def _freeze(value):
+    """
+    Convert nested dicts and lists into hashable tuples
+
+    Args:
+        value: Model attribute value
+
+    Returns:
+        Hashable representation of the value
+    """
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _copy(value):
+    """
+    Copy the dicts and lists of a valuation result
+
+    Results are built from dicts, lists and immutable scalars, so only the
+    containers need to be rebuilt. Anything else falls back to deepcopy.
+
+    Args:
+        value: Valuation result or part of one
+
+    Returns:
+        Copy of the value that shares no mutable containers
+    """
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    return copy.deepcopy(value)
+
+
+def cached_valuation(run_valuation):
+    """
+    Memoize a model's run_valuation on its class and constructor inputs
+
+    Models are pure functions of the attributes set in __init__, so two
+    instances with identical inputs produce identical results. Callers
+    receive a copy because the pages add keys to the returned dict. Only
+    decorate methods that do no network fetches: the cache has no expiry,
+    so fetched data would be pinned for the life of the process.
+
+    Args:
+        run_valuation (callable): The model's run_valuation method, or
+            another method computing results from the inputs alone
+
+    Returns:
+        callable: Memoized run_valuation
+    """
+    @wraps(run_valuation)
+    def wrapper(self):
+        try:
+            key = (type(self), run_valuation.__name__, _freeze(vars(self)))
+            hash(key)
+        except TypeError:
+            # Unhashable inputs, skip the cache
+            return run_valuation(self)
+
+        with _lock:
+            result = _results.get(key)
+            if result is not None:
+                _results.move_to_end(key)
+
+        if result is None:
+            result = run_valuation(self)
+            with _lock:
+                _results[key] = result
+                if len(_results) > MAX_CACHED_VALUATIONS:
+                    _results.popitem(last=False)
+
+        return _copy(result)
+
+    return wrapper
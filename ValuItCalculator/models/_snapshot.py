@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+
+
+def _latest(financial_data, key, default=None):
+    """
+    Get the most recent value of a financial metric
+
+    Args:
+        financial_data (dict): Historical financial data keyed by metric
+        key (str): Metric name
+        default: Value returned when the metric is not available
+
+    Returns:
+        float: Most recent value or the default
+    """
+    series = financial_data.get(key)
+    if series:
+        # Periods are ordered most recent first
+        return next(iter(series.values()))
+    return default
+
+
+@dataclass(slots=True, frozen=True)
+class FinancialSnapshot:
+    """
+    Most recent value of each financial metric used by the valuation models
+
+    Metrics that are not reported are None, except debt and cash which
+    default to 0.
+    """
+
+    revenue: float | None = None
+    ebitda: float | None = None
+    net_income: float | None = None
+    fcf: float | None = None
+    total_assets: float | None = None
+    total_liabilities: float | None = None
+    equity: float | None = None
+    total_debt: float = 0
+    cash: float = 0
+
+    @classmethod
+    def from_dict(cls, financial_data):
+        """
+        Build a snapshot from historical financial data
+
+        Args:
+            financial_data (dict): Historical financial data keyed by metric
+
+        Returns:
+            FinancialSnapshot: Latest values with defaults applied
+        """
+        total_debt = _latest(financial_data, 'total_debt')
+        total_liabilities = _latest(financial_data, 'total_liabilities')
+
+        if total_liabilities is None and total_debt is not None:
+            # Estimate total liabilities as 1.5x debt (including non-debt liabilities)
+            total_liabilities = total_debt * 1.5
+
+        return cls(
+            revenue=_latest(financial_data, 'revenue'),
+            ebitda=_latest(financial_data, 'ebitda'),
+            net_income=_latest(financial_data, 'net_income'),
+            fcf=_latest(financial_data, 'fcf'),
+            total_assets=_latest(financial_data, 'total_assets'),
+            total_liabilities=total_liabilities,
+            equity=_latest(financial_data, 'equity'),
+            total_debt=total_debt if total_debt is not None else 0,
+            cash=_latest(financial_data, 'cash', 0),
+        )
@@ -1,6 +1,5 @@
-import numpy as np
-import pandas as pd
-from datetime import datetime
+from models._cache import cached_valuation
+from models._snapshot import FinancialSnapshot
 
 class AssetBasedModel:
     """
@@ -19,28 +18,32 @@ class AssetBasedModel:
             asset_discount (float): Discount to apply to asset values (0-1)
         """
         self.financial_data = financial_data
+        self.snapshot = FinancialSnapshot.from_dict(financial_data)
         self.asset_discount = asset_discount
+        
+        # Balance sheet totals, with fallbacks applied once rather than on every run
+        self.total_assets, self.total_liabilities = self._estimate_balance_sheet()
     
-    def run_valuation(self):
+    def _estimate_balance_sheet(self):
         """
-        Run the asset-based valuation
+        Get total assets and liabilities, estimating them when not reported
         
         Returns:
-            dict: Valuation results
+            tuple: Total assets and total liabilities
         """
         # Get total assets and liabilities
-        total_assets = self._get_total_assets()
-        total_liabilities = self._get_total_liabilities()
+        total_assets = self.snapshot.total_assets
+        total_liabilities = self.snapshot.total_liabilities
         
         if total_assets is None:
             # If no asset data, use equity and liabilities to back-calculate
-            equity = self._get_equity()
+            equity = self.snapshot.equity
             if equity is not None and total_liabilities is not None:
                 total_assets = equity + total_liabilities
         
         if total_liabilities is None:
             # If no liability data, use assets and equity to back-calculate
-            equity = self._get_equity()
+            equity = self.snapshot.equity
             if equity is not None and total_assets is not None:
                 total_liabilities = total_assets - equity
         
@@ -51,6 +54,19 @@ class AssetBasedModel:
         if total_liabilities is None:
             total_liabilities = total_assets * 0.6  # Default 60% liability-to-asset ratio
         
+        return total_assets, total_liabilities
+    
+    @cached_valuation
+    def run_valuation(self):
+        """
+        Run the asset-based valuation
+        
+        Returns:
+            dict: Valuation results
+        """
+        total_assets = self.total_assets
+        total_liabilities = self.total_liabilities
+        
         # Calculate book value of equity
         book_equity = total_assets - total_liabilities
         
@@ -74,47 +90,3 @@ class AssetBasedModel:
                 'adjusted_equity': adjusted_equity
             }
         }
-    
-    def _get_total_assets(self):
-        """
-        Get the most recent total assets value
-        
-        Returns:
-            float: Total assets or None if not available
-        """
-        if 'total_assets' in self.financial_data and self.financial_data['total_assets']:
-            # Get the most recent total assets value
-            return list(self.financial_data['total_assets'].values())[0]
-        return None
-    
-    def _get_total_liabilities(self):
-        """
-        Get the most recent total liabilities value
-        
-        Returns:
-            float: Total liabilities or None if not available
-        """
-        # If total liabilities is directly available
-        if 'total_liabilities' in self.financial_data and self.financial_data['total_liabilities']:
-            return list(self.financial_data['total_liabilities'].values())[0]
-        
-        # Otherwise, try to calculate from debt
-        if 'total_debt' in self.financial_data and self.financial_data['total_debt']:
-            debt = list(self.financial_data['total_debt'].values())[0]
-            # Estimate total liabilities as 1.5x debt (including non-debt liabilities)
-            return debt * 1.5
-        
-        return None
-    
-    def _get_equity(self):
-        """
-        Get the most recent equity value
-        
-        Returns:
-            float: Equity or None if not available
-        """
-        if 'equity' in self.financial_data and self.financial_data['equity']:
-            # Get the most recent equity value
-            return list(self.financial_data['equity'].values())[0]
-        return None
-
@@ -1,7 +1,8 @@
 import numpy as np
 import pandas as pd
-from datetime import datetime
 
+from models._cache import cached_valuation
+from models._snapshot import FinancialSnapshot
 from utils.data_fetcher import DataFetcher
 
 class ComparableCompanyModel:
@@ -25,6 +26,7 @@ class ComparableCompanyModel:
             ev_revenue_multiple (float): EV/Revenue multiple to apply
         """
         self.financial_data = financial_data
+        self.snapshot = FinancialSnapshot.from_dict(financial_data)
         self.industry = industry
         self.ticker = ticker
         self.ev_ebitda_multiple = ev_ebitda_multiple
@@ -38,12 +40,28 @@ class ComparableCompanyModel:
         Returns:
             dict: Valuation results
         """
+        results = self._apply_multiples()
+        
+        # Comparable companies are fetched outside the memoized math, so a failed
+        # or stale peer lookup is never cached with the result
+        results['comps_details']['comparable_companies'] = self._get_comparable_companies()
+        
+        return results
+    
+    @cached_valuation
+    def _apply_multiples(self):
+        """
+        Apply the multiples to the subject company's financial metrics
+        
+        Returns:
+            dict: Valuation results without the comparable companies
+        """
         # Get the latest financial metrics
-        ebitda = self._get_ebitda()
-        net_income = self._get_net_income()
-        revenue = self._get_revenue()
-        debt = self._get_debt()
-        cash = self._get_cash()
+        ebitda = self.snapshot.ebitda
+        net_income = self.snapshot.net_income
+        revenue = self.snapshot.revenue
+        debt = self.snapshot.total_debt
+        cash = self.snapshot.cash
         
         # Calculate enterprise value using multiples
         ev_ebitda_valuation = ebitda * self.ev_ebitda_multiple if ebitda is not None else None
@@ -56,9 +74,6 @@ class ComparableCompanyModel:
         
         # PE already gives equity value
         
-        # Get comparable companies
-        comparable_companies = self._get_comparable_companies()
-        
         # Determine the primary enterprise value (prioritize EV/EBITDA if available)
         if ev_ebitda_valuation is not None:
             primary_ev = ev_ebitda_valuation
@@ -92,70 +107,63 @@ class ComparableCompanyModel:
                 'cash': cash,
                 'ev_ebitda_valuation': ev_ebitda_valuation,
                 'pe_valuation': pe_valuation,
-                'ev_revenue_valuation': ev_revenue_valuation,
-                'comparable_companies': comparable_companies
+                'ev_revenue_valuation': ev_revenue_valuation
             }
         }
     
-    def _get_ebitda(self):
+    @classmethod
+    def run_batch(cls, companies):
         """
-        Get the most recent EBITDA value
+        Run the comparable company valuation for many companies at once
         
-        Returns:
-            float: EBITDA or None if not available
-        """
-        if 'ebitda' in self.financial_data and self.financial_data['ebitda']:
-            # Get the most recent EBITDA value
-            return list(self.financial_data['ebitda'].values())[0]
-        return None
-    
-    def _get_net_income(self):
-        """
-        Get the most recent net income value
+        Applies the same multiples and primary-method priority as
+        run_valuation, using column arithmetic instead of one model per row.
+        Comparable companies are not fetched.
         
-        Returns:
-            float: Net income or None if not available
-        """
-        if 'net_income' in self.financial_data and self.financial_data['net_income']:
-            # Get the most recent net income value
-            return list(self.financial_data['net_income'].values())[0]
-        return None
-    
-    def _get_revenue(self):
-        """
-        Get the most recent revenue value
+        Args:
+            companies (pd.DataFrame): One row per company with columns ebitda,
+                net_income, revenue, debt, cash, ev_ebitda_multiple, pe_ratio
+                and ev_revenue_multiple. Missing metrics are NaN.
         
         Returns:
-            float: Revenue or None if not available
+            pd.DataFrame: Valuation results per company, indexed like the input
         """
-        if 'revenue' in self.financial_data and self.financial_data['revenue']:
-            # Get the most recent revenue value
-            return list(self.financial_data['revenue'].values())[0]
-        return None
-    
-    def _get_debt(self):
-        """
-        Get the most recent debt value
+        # Missing debt and cash count as zero, as in run_valuation
+        debt = companies['debt'].fillna(0)
+        cash = companies['cash'].fillna(0)
         
-        Returns:
-            float: Debt or 0 if not available
-        """
-        if 'total_debt' in self.financial_data and self.financial_data['total_debt']:
-            # Get the most recent debt value
-            return list(self.financial_data['total_debt'].values())[0]
-        return 0
-    
-    def _get_cash(self):
-        """
-        Get the most recent cash value
+        # Calculate enterprise value using multiples
+        ev_ebitda_valuation = companies['ebitda'] * companies['ev_ebitda_multiple']
+        pe_valuation = companies['net_income'] * companies['pe_ratio']
+        ev_revenue_valuation = companies['revenue'] * companies['ev_revenue_multiple']
         
-        Returns:
-            float: Cash or 0 if not available
-        """
-        if 'cash' in self.financial_data and self.financial_data['cash']:
-            # Get the most recent cash value
-            return list(self.financial_data['cash'].values())[0]
-        return 0
+        # Calculate equity values
+        eq_ebitda_valuation = ev_ebitda_valuation - debt + cash
+        eq_revenue_valuation = ev_revenue_valuation - debt + cash
+        
+        # Determine the primary values (EV/EBITDA, then EV/Revenue, then P/E)
+        primary_ev = (ev_ebitda_valuation
+                      .fillna(ev_revenue_valuation)
+                      .fillna(pe_valuation + debt - cash)
+                      .fillna(0))
+        primary_equity = (eq_ebitda_valuation
+                          .fillna(eq_revenue_valuation)
+                          .fillna(pe_valuation)
+                          .fillna(0))
+        primary_method = np.select(
+            [ev_ebitda_valuation.notna(), ev_revenue_valuation.notna(), pe_valuation.notna()],
+            ["EV/EBITDA", "EV/Revenue", "P/E"],
+            default="N/A"
+        )
+        
+        return pd.DataFrame({
+            'enterprise_value': primary_ev,
+            'equity_value': primary_equity,
+            'primary_method': primary_method,
+            'ev_ebitda_valuation': ev_ebitda_valuation,
+            'pe_valuation': pe_valuation,
+            'ev_revenue_valuation': ev_revenue_valuation
+        }, index=companies.index)
     
     def _get_comparable_companies(self):
         """
@@ -170,4 +178,3 @@ class ComparableCompanyModel:
         except Exception as e:
             print(f"Error fetching comparable companies: {e}")
             return []
-
@@ -1,6 +1,13 @@
+from bisect import bisect_left
+
 import numpy as np
-import pandas as pd
-from datetime import datetime
+
+from models._cache import cached_valuation
+from models._snapshot import FinancialSnapshot
+
+# Entry multiple by target IRR: above each threshold the multiple steps down
+_IRR_THRESHOLDS = (0.15, 0.20, 0.25)
+_ENTRY_MULTIPLES = (9.0, 8.0, 7.0, 6.0)
 
 class LBOModel:
     """
@@ -21,25 +28,26 @@ class LBOModel:
             target_irr (float): Target Internal Rate of Return
         """
         self.financial_data = financial_data
+        self.snapshot = FinancialSnapshot.from_dict(financial_data)
         self.exit_year = exit_year
         self.exit_multiple = exit_multiple
         self.target_irr = target_irr
+        
+        # Base EBITDA, with fallbacks applied once rather than on every run
+        self.base_ebitda = self._estimate_base_ebitda()
     
-    def run_valuation(self):
+    def _estimate_base_ebitda(self):
         """
-        Run the LBO valuation
+        Get the base year EBITDA, estimating it when not reported
         
         Returns:
-            dict: Valuation results
+            float: Base year EBITDA
         """
-        # Get the base financial metrics
-        base_ebitda = self._get_base_ebitda()
-        base_revenue = self._get_base_revenue()
-        current_debt = self._get_debt()
-        current_cash = self._get_cash()
+        base_ebitda = self.snapshot.ebitda
         
         # Use default value if EBITDA not available
         if base_ebitda is None:
+            base_revenue = self.snapshot.revenue
             if base_revenue is not None:
                 # Estimate EBITDA from revenue (assuming 20% EBITDA margin)
                 base_ebitda = base_revenue * 0.2
@@ -47,6 +55,18 @@ class LBOModel:
                 # Default value if no data available
                 base_ebitda = 100000000  # $100M EBITDA
         
+        return base_ebitda
+    
+    @cached_valuation
+    def run_valuation(self):
+        """
+        Run the LBO valuation
+        
+        Returns:
+            dict: Valuation results
+        """
+        base_ebitda = self.base_ebitda
+        
         # Calculate entry multiple based on target IRR
         entry_multiple = self._calculate_entry_multiple(base_ebitda)
         
@@ -65,12 +85,11 @@ class LBOModel:
         ebitda_projection = self._project_ebitda(base_ebitda)
         
         # Calculate exit value
-        exit_ebitda = ebitda_projection[-1]
+        exit_ebitda = float(ebitda_projection[-1])
         exit_value = exit_ebitda * self.exit_multiple
         
-        # Assume debt is paid down linearly
-        annual_debt_payment = new_debt / self.exit_year
-        exit_debt = new_debt - (annual_debt_payment * self.exit_year)
+        # Debt is paid down linearly and fully repaid by the exit year
+        exit_debt = 0.0
         
         # Exit equity value
         exit_equity = exit_value - exit_debt
@@ -97,7 +116,7 @@ class LBOModel:
                 'purchase_price': purchase_price,
                 'new_debt': new_debt,
                 'new_equity': new_equity,
-                'ebitda_projection': ebitda_projection,
+                'ebitda_projection': ebitda_projection.tolist(),
                 'exit_ebitda': exit_ebitda,
                 'exit_value': exit_value,
                 'exit_debt': exit_debt,
@@ -109,54 +128,6 @@ class LBOModel:
             }
         }
     
-    def _get_base_ebitda(self):
-        """
-        Get the base year EBITDA
-        
-        Returns:
-            float: Base year EBITDA or None if not available
-        """
-        if 'ebitda' in self.financial_data and self.financial_data['ebitda']:
-            # Get the most recent EBITDA value
-            return list(self.financial_data['ebitda'].values())[0]
-        return None
-    
-    def _get_base_revenue(self):
-        """
-        Get the base year revenue
-        
-        Returns:
-            float: Base year revenue or None if not available
-        """
-        if 'revenue' in self.financial_data and self.financial_data['revenue']:
-            # Get the most recent revenue value
-            return list(self.financial_data['revenue'].values())[0]
-        return None
-    
-    def _get_debt(self):
-        """
-        Get the current debt
-        
-        Returns:
-            float: Current debt or 0 if not available
-        """
-        if 'total_debt' in self.financial_data and self.financial_data['total_debt']:
-            # Get the most recent debt value
-            return list(self.financial_data['total_debt'].values())[0]
-        return 0
-    
-    def _get_cash(self):
-        """
-        Get the current cash
-        
-        Returns:
-            float: Current cash or 0 if not available
-        """
-        if 'cash' in self.financial_data and self.financial_data['cash']:
-            # Get the most recent cash value
-            return list(self.financial_data['cash'].values())[0]
-        return 0
-    
     def _calculate_entry_multiple(self, base_ebitda):
         """
         Calculate entry multiple based on target IRR
@@ -169,14 +140,8 @@ class LBOModel:
         """
         # Start with typical LBO multiple range of 6-8x
         # Adjust based on target IRR (higher IRR -> lower entry multiple)
-        if self.target_irr > 0.25:
-            return 6.0
-        elif self.target_irr > 0.20:
-            return 7.0
-        elif self.target_irr > 0.15:
-            return 8.0
-        else:
-            return 9.0
+        # bisect_left counts the thresholds strictly below the target IRR
+        return _ENTRY_MULTIPLES[bisect_left(_IRR_THRESHOLDS, self.target_irr)]
     
     def _project_ebitda(self, base_ebitda):
         """
@@ -186,24 +151,16 @@ class LBOModel:
             base_ebitda (float): Base year EBITDA
             
         Returns:
-            list: Projected EBITDA values
+            np.ndarray: Projected EBITDA values
         """
-        ebitda_projection = []
-        current_ebitda = base_ebitda
+        years = np.arange(1, self.exit_year + 1)
         
         # Assume standard growth rates for LBO:
         # - Years 1-2: Higher growth from operational improvements (10%)
         # - Years 3+: Moderate growth (5%)
-        for year in range(1, self.exit_year + 1):
-            if year <= 2:
-                growth_rate = 0.10
-            else:
-                growth_rate = 0.05
-            
-            current_ebitda = current_ebitda * (1 + growth_rate)
-            ebitda_projection.append(current_ebitda)
+        growth_factors = np.where(years <= 2, 1.10, 1.05)
         
-        return ebitda_projection
+        return base_ebitda * np.cumprod(growth_factors)
     
     def _calculate_max_debt(self, base_ebitda):
         """
@@ -234,38 +191,25 @@ class LBOModel:
         # Create a range of entry multiples to test
         entry_multiples = [5.0, 6.0, 7.0, 8.0, 9.0]
         
-        # Calculate IRR for each entry multiple
-        irr_values = []
+        # The exit side does not depend on the entry multiple, so project EBITDA once
+        ebitda_projection = self._project_ebitda(base_ebitda)
+        exit_ebitda = ebitda_projection[-1]
+        exit_value = exit_ebitda * self.exit_multiple
         
-        for multiple in entry_multiples:
-            # Calculate purchase price
-            purchase_price = multiple * base_ebitda
-            
-            # Assume standard LBO capital structure (70% debt, 30% equity)
-            new_equity = purchase_price * 0.3
-            
-            # Project EBITDA growth
-            ebitda_projection = self._project_ebitda(base_ebitda)
-            
-            # Calculate exit value
-            exit_ebitda = ebitda_projection[-1]
-            exit_value = exit_ebitda * self.exit_multiple
-            
-            # Assume debt is paid down linearly
-            new_debt = purchase_price * 0.7
-            annual_debt_payment = new_debt / self.exit_year
-            exit_debt = new_debt - (annual_debt_payment * self.exit_year)
-            
-            # Exit equity value
-            exit_equity = exit_value - exit_debt
-            
-            # Calculate equity multiple and IRR
-            equity_multiple = exit_equity / new_equity
-            irr = (equity_multiple ** (1 / self.exit_year)) - 1
-            
-            irr_values.append(irr)
+        # Calculate purchase price for every entry multiple at once
+        purchase_price = np.array(entry_multiples) * base_ebitda
+        
+        # Assume standard LBO capital structure (70% debt, 30% equity)
+        new_equity = purchase_price * 0.3
+        
+        # Debt is fully repaid by the exit year, so exit equity is the exit value
+        exit_equity = exit_value
+        
+        # Calculate equity multiple and IRR
+        equity_multiple = exit_equity / new_equity
+        irr_values = (equity_multiple ** (1 / self.exit_year)) - 1
         
         return {
             'entry_multiples': entry_multiples,
-            'irr_values': irr_values
+            'irr_values': irr_values.tolist()
         }
@@ -1,9 +1,24 @@
-import numpy as np
-import pandas as pd
-from datetime import datetime
+from functools import lru_cache
 
+from models._cache import cached_valuation
+from models._snapshot import FinancialSnapshot
 from utils.data_fetcher import DataFetcher
 
+
+@lru_cache(maxsize=64)
+def _cached_precedents(industry):
+    """
+    Memoized precedent transactions lookup for an industry
+    
+    Args:
+        industry (str): Industry name
+        
+    Returns:
+        tuple: Precedent transactions with key metrics
+    """
+    return tuple(DataFetcher.get_precedent_transactions(industry))
+
+
 class PrecedentTransactionsModel:
     """
     Precedent Transactions valuation model
@@ -23,10 +38,12 @@ class PrecedentTransactionsModel:
             ev_revenue_multiple (float): EV/Revenue multiple to apply
         """
         self.financial_data = financial_data
+        self.snapshot = FinancialSnapshot.from_dict(financial_data)
         self.industry = industry
         self.ev_ebitda_multiple = ev_ebitda_multiple
         self.ev_revenue_multiple = ev_revenue_multiple
     
+    @cached_valuation
     def run_valuation(self):
         """
         Run the precedent transactions valuation
@@ -35,14 +52,18 @@ class PrecedentTransactionsModel:
             dict: Valuation results
         """
         # Get the latest financial metrics
-        ebitda = self._get_ebitda()
-        revenue = self._get_revenue()
-        debt = self._get_debt()
-        cash = self._get_cash()
+        ebitda = self.snapshot.ebitda
+        revenue = self.snapshot.revenue
+        debt = self.snapshot.total_debt
+        cash = self.snapshot.cash
         
-        # Calculate enterprise value using multiples
-        ev_ebitda_valuation = ebitda * self.ev_ebitda_multiple if ebitda is not None else None
-        ev_revenue_valuation = revenue * self.ev_revenue_multiple if revenue is not None else None
+        # Calculate enterprise value using multiples (a multiple left as None skips that method)
+        ev_ebitda_valuation = None
+        if ebitda is not None and self.ev_ebitda_multiple is not None:
+            ev_ebitda_valuation = ebitda * self.ev_ebitda_multiple
+        ev_revenue_valuation = None
+        if revenue is not None and self.ev_revenue_multiple is not None:
+            ev_revenue_valuation = revenue * self.ev_revenue_multiple
         
         # Calculate equity values
         eq_ebitda_valuation = ev_ebitda_valuation - debt + cash if ev_ebitda_valuation is not None else None
@@ -83,54 +104,6 @@ class PrecedentTransactionsModel:
             }
         }
     
-    def _get_ebitda(self):
-        """
-        Get the most recent EBITDA value
-        
-        Returns:
-            float: EBITDA or None if not available
-        """
-        if 'ebitda' in self.financial_data and self.financial_data['ebitda']:
-            # Get the most recent EBITDA value
-            return list(self.financial_data['ebitda'].values())[0]
-        return None
-    
-    def _get_revenue(self):
-        """
-        Get the most recent revenue value
-        
-        Returns:
-            float: Revenue or None if not available
-        """
-        if 'revenue' in self.financial_data and self.financial_data['revenue']:
-            # Get the most recent revenue value
-            return list(self.financial_data['revenue'].values())[0]
-        return None
-    
-    def _get_debt(self):
-        """
-        Get the most recent debt value
-        
-        Returns:
-            float: Debt or 0 if not available
-        """
-        if 'total_debt' in self.financial_data and self.financial_data['total_debt']:
-            # Get the most recent debt value
-            return list(self.financial_data['total_debt'].values())[0]
-        return 0
-    
-    def _get_cash(self):
-        """
-        Get the most recent cash value
-        
-        Returns:
-            float: Cash or 0 if not available
-        """
-        if 'cash' in self.financial_data and self.financial_data['cash']:
-            # Get the most recent cash value
-            return list(self.financial_data['cash'].values())[0]
-        return 0
-    
     def _get_precedent_transactions(self):
         """
         Get precedent transactions data
@@ -139,8 +112,8 @@ class PrecedentTransactionsModel:
             list: List of precedent transactions with key metrics
         """
         try:
-            transactions = DataFetcher.get_precedent_transactions(self.industry)
-            return transactions
+            # Copy the cached transaction dicts so callers cannot modify the cache
+            return [dict(transaction) for transaction in _cached_precedents(self.industry)]
         except Exception as e:
             print(f"Error fetching precedent transactions: {e}")
             return []
@@ -1,22 +1,37 @@
 # This makes the pages directory a Python package
 # and enables importing modules from it
 
-# Import all page modules to make them accessible from pages
-from .about import show as about_show
-from .company_info import show as company_info_show
-from .faq import show as faq_show
-from .home import show as home_show
-from .learn import show as learn_show
-from .my_valuations import show as my_valuations_show
-from .professional_mode import show as professional_mode_show
-from .valuation_tool import show as valuation_tool_show
+import importlib
 
-# Create aliases for the imported show functions
-home = home_show
-valuation_tool = valuation_tool_show
-my_valuations = my_valuations_show
-professional_mode = professional_mode_show
-learn = learn_show
-company_info = company_info_show
-about = about_show
-faq = faq_show
\ No newline at end of file
+# Page name -> module providing its show function. Modules are imported the
+# first time a page is accessed, so app startup only loads the page shown.
+_PAGE_MODULES = {
+    'home': 'home',
+    'valuation_tool': 'valuation_tool',
+    'my_valuations': 'my_valuations',
+    'professional_mode': 'professional_mode',
+    'learn': 'learn',
+    'company_info': 'company_info',
+    'about': 'about',
+    'faq': 'faq',
+}
+
+__all__ = list(_PAGE_MODULES)
+
+
+def __getattr__(name):
+    """
+    Import a page module on first access and return its show function
+    
+    Args:
+        name (str): Page name
+        
+    Returns:
+        callable: The page's show function
+    """
+    if name in _PAGE_MODULES:
+        module = importlib.import_module('.' + _PAGE_MODULES[name], __name__)
+        # Replace the submodule attribute set by the import with the show function
+        globals()[name] = module.show
+        return module.show
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
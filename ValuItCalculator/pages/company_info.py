@@ -1,10 +1,453 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
 
 from utils.data_fetcher import DataFetcher
+from utils.downsampling import downsample_frame
+
+# Fetched data is reused across reruns for an hour, so clicking around the
+# page does not go back to the network
+CACHE_TTL_SECONDS = 3600
+
+def _submit_fetch(executor, fetch, *args):
+    """
+    Start a fetch on an executor, attached to the current session
+    
+    Worker threads have no script context of their own, and st.cache_data
+    needs one, so each task attaches the calling session's context first.
+    
+    Args:
+        executor (ThreadPoolExecutor): Executor for this page render
+        fetch (callable): Cached fetch function
+        *args: Arguments for the fetch
+    
+    Returns:
+        concurrent.futures.Future: The fetch result
+    """
+    ctx = get_script_run_ctx()
+    
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fetch(*args)
+    
+    return executor.submit(run)
+
+# Static chart settings shared by every render. Plotly copies these into the
+# figure, so they are never modified.
+_HORIZONTAL_LEGEND = dict(
+    orientation="h",
+    yanchor="bottom",
+    y=1.02,
+    xanchor="right",
+    x=1
+)
+
+_ESG_GAUGE_BASE = {
+    'axis': {'range': [None, 100]},
+    'bar': {'color': "#0066cc"},
+    'steps': [
+        {'range': [0, 33], 'color': "#ffcccc"},
+        {'range': [33, 66], 'color': "#ffffcc"},
+        {'range': [66, 100], 'color': "#ccffcc"}
+    ]
+}
+
+# The threshold marker sits at the company's score, added per render
+_ESG_GAUGE_THRESHOLD = {
+    'line': {'color': "red", 'width': 4},
+    'thickness': 0.75
+}
+
+_ESG_GAUGE_MARGIN = dict(l=20, r=20, t=30, b=20)
+_ESG_RADAR_MARGIN = dict(l=20, r=20, t=20, b=20)
+
+# Views of the Financial Performance section, one shown at a time
+_FINANCIAL_VIEWS = ("Revenue & Profitability", "Balance Sheet", "Cash Flow", "Ratios")
+
+# Sample companies shown before a ticker is entered, with the sector list
+# and per-sector tables worked out once at import
+_SAMPLE_COMPANIES = (
+    {"ticker": "AAPL", "name": "Apple Inc.", "sector": "Technology"},
+    {"ticker": "MSFT", "name": "Microsoft Corporation", "sector": "Technology"},
+    {"ticker": "AMZN", "name": "Amazon.com, Inc.", "sector": "Consumer Cyclical"},
+    {"ticker": "GOOGL", "name": "Alphabet Inc.", "sector": "Communication Services"},
+    {"ticker": "JNJ", "name": "Johnson & Johnson", "sector": "Healthcare"},
+    {"ticker": "JPM", "name": "JPMorgan Chase & Co.", "sector": "Financial Services"},
+    {"ticker": "PG", "name": "Procter & Gamble Co.", "sector": "Consumer Defensive"},
+    {"ticker": "XOM", "name": "Exxon Mobil Corporation", "sector": "Energy"},
+    {"ticker": "TSLA", "name": "Tesla, Inc.", "sector": "Consumer Cyclical"},
+    {"ticker": "V", "name": "Visa Inc.", "sector": "Financial Services"}
+)
+
+_SECTORS = ("All",) + tuple(sorted({company['sector'] for company in _SAMPLE_COMPANIES}))
+
+_SAMPLE_TABLES = {"All": pd.DataFrame(list(_SAMPLE_COMPANIES))}
+_SAMPLE_TABLES.update({
+    sector: pd.DataFrame([company for company in _SAMPLE_COMPANIES if company['sector'] == sector])
+    for sector in _SECTORS[1:]
+})
+
+class _PlaceholderResult(Exception):
+    """
+    Raised inside a cached fetch when DataFetcher returned its failure placeholder
+    
+    st.cache_data does not cache calls that raise, so a transient failure (such
+    as a rate limit) is retried on the next run instead of being served to every
+    session for CACHE_TTL_SECONDS.
+    """
+    
+    def __init__(self, result):
+        super().__init__("DataFetcher returned placeholder data")
+        self.result = result
+
+def _uncached_placeholders(cached_fetch):
+    """
+    Return placeholder results from a cached fetch without caching them
+    
+    Args:
+        cached_fetch (callable): st.cache_data function that raises _PlaceholderResult
+    
+    Returns:
+        callable: The fetch, returning the placeholder instead of raising
+    """
+    @wraps(cached_fetch)
+    def fetch(*args):
+        try:
+            return cached_fetch(*args)
+        except _PlaceholderResult as placeholder:
+            return placeholder.result
+    
+    return fetch
+
+@_uncached_placeholders
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_company_info(ticker):
+    """Cached DataFetcher.get_company_info"""
+    company_info = DataFetcher.get_company_info(ticker)
+    # No name (e.g. a rate-limited lookup) or the placeholder for a failed fetch
+    if (company_info.get('name', 'N/A') == 'N/A'
+            or company_info.get('description') == 'Could not fetch company description.'):
+        raise _PlaceholderResult(company_info)
+    return company_info
+
+@_uncached_placeholders
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_financial_data(ticker):
+    """Cached DataFetcher.get_financial_data"""
+    financial_data = DataFetcher.get_financial_data(ticker)
+    if not any(financial_data.values()):
+        raise _PlaceholderResult(financial_data)
+    return financial_data
+
+@_uncached_placeholders
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_esg_metrics(ticker):
+    """Cached DataFetcher.get_esg_metrics"""
+    esg_data = DataFetcher.get_esg_metrics(ticker)
+    if all(value == 'N/A' for value in esg_data.values()):
+        raise _PlaceholderResult(esg_data)
+    return esg_data
+
+@_uncached_placeholders
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_comparable_companies(ticker, industry):
+    """Cached DataFetcher.get_comparable_companies"""
+    comparable_companies = DataFetcher.get_comparable_companies(ticker, industry)
+    if not comparable_companies:
+        raise _PlaceholderResult(comparable_companies)
+    return comparable_companies
+
+def _most_recent(data, default=0):
+    """
+    Get the most recent value of a date-keyed series without copying it
+    
+    Args:
+        data (dict): Values keyed by date, most recent first
+        default: Value to return when the series is empty
+    
+    Returns:
+        The first value in the series, or the default
+    """
+    return next(iter(data.values()), default)
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def _build_financial_figures(ticker, _financial_data):
+    """
+    Build the Financial Performance charts and ratio table for a company
+    
+    Cached per ticker (financial data is cached per ticker too), so reruns
+    reuse the figures instead of rebuilding them. The leading underscore
+    keeps Streamlit from hashing the financial data.
+    
+    Args:
+        ticker (str): Company ticker symbol
+        _financial_data (dict): Financial data for the company
+    
+    Returns:
+        dict: Figures and the ratio table by name, only those with enough data
+    """
+    # Look up each series once
+    revenue_data = _financial_data.get('revenue', {})
+    ebitda_data = _financial_data.get('ebitda', {})
+    net_income_data = _financial_data.get('net_income', {})
+    assets_data = _financial_data.get('total_assets', {})
+    equity_data = _financial_data.get('equity', {})
+    debt_data = _financial_data.get('total_debt', {})
+    fcf_data = _financial_data.get('fcf', {})
+    
+    figures = {}
+    
+    # Revenue and EBITDA chart
+    if revenue_data and ebitda_data:
+        # Convert to DataFrame (outer join on date, oldest first)
+        fin_df = pd.DataFrame({'Revenue': revenue_data, 'EBITDA': ebitda_data}).sort_index()
+        
+        # Revenue/EBITDA bars above the EBITDA margin line, in one figure
+        # (long histories are downsampled)
+        fin_df['EBITDA Margin'] = fin_df['EBITDA'] / fin_df['Revenue']
+        fig = make_subplots(
+            rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.12,
+            subplot_titles=('Revenue and EBITDA', 'EBITDA Margin')
+        )
+        
+        plot_df = downsample_frame(fin_df, 'Revenue')
+        fig.add_trace(go.Bar(
+            x=plot_df.index,
+            y=plot_df['Revenue'],
+            name='Revenue',
+            marker_color='#0066cc'
+        ), row=1, col=1)
+        
+        fig.add_trace(go.Bar(
+            x=plot_df.index,
+            y=plot_df['EBITDA'],
+            name='EBITDA',
+            marker_color='#00cc66'
+        ), row=1, col=1)
+        
+        plot_df = downsample_frame(fin_df, 'EBITDA Margin')
+        fig.add_trace(go.Scattergl(
+            x=plot_df.index,
+            y=plot_df['EBITDA Margin'],
+            mode='lines+markers',
+            name='EBITDA Margin',
+            line=dict(color='#cc6600', width=3)
+        ), row=2, col=1)
+        
+        fig.update_layout(
+            height=700,
+            barmode='group',
+            legend=_HORIZONTAL_LEGEND
+        )
+        fig.update_yaxes(title_text='Value', row=1, col=1)
+        fig.update_yaxes(title_text='Margin', tickformat='.0%', row=2, col=1)
+        fig.update_xaxes(title_text='Year', row=2, col=1)
+        
+        figures['revenue_ebitda'] = fig
+    
+    # Net income chart
+    if net_income_data:
+        # Convert to DataFrame (oldest first)
+        ni_df = pd.DataFrame({'Net Income': net_income_data}).sort_index()
+        
+        # Create a bar chart with Plotly (long histories are downsampled)
+        plot_df = downsample_frame(ni_df, 'Net Income')
+        fig = go.Figure()
+        
+        fig.add_trace(go.Bar(
+            x=plot_df.index,
+            y=plot_df['Net Income'],
+            name='Net Income',
+            marker_color='#0066cc'
+        ))
+        
+        fig.update_layout(
+            title='Net Income',
+            xaxis_title='Year',
+            yaxis_title='Value'
+        )
+        
+        figures['net_income'] = fig
+    
+    # Balance sheet items
+    if assets_data and equity_data:
+        # Convert to DataFrame (outer join on date, oldest first)
+        bs_df = pd.DataFrame({
+            'Total Assets': assets_data,
+            'Equity': equity_data,
+            'Debt': debt_data
+        }).sort_index()
+        
+        # Balance sheet bars above the Debt-to-Equity line, in one figure
+        # (long histories are downsampled)
+        bs_df['Debt-to-Equity'] = bs_df['Debt'] / bs_df['Equity']
+        fig = make_subplots(
+            rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.12,
+            subplot_titles=('Balance Sheet Items', 'Debt-to-Equity Ratio')
+        )
+        
+        plot_df = downsample_frame(bs_df, 'Total Assets')
+        fig.add_trace(go.Bar(
+            x=plot_df.index,
+            y=plot_df['Total Assets'],
+            name='Total Assets',
+            marker_color='#0066cc'
+        ), row=1, col=1)
+        
+        fig.add_trace(go.Bar(
+            x=plot_df.index,
+            y=plot_df['Equity'],
+            name='Equity',
+            marker_color='#00cc66'
+        ), row=1, col=1)
+        
+        fig.add_trace(go.Bar(
+            x=plot_df.index,
+            y=plot_df['Debt'],
+            name='Debt',
+            marker_color='#cc6600'
+        ), row=1, col=1)
+        
+        plot_df = downsample_frame(bs_df, 'Debt-to-Equity')
+        fig.add_trace(go.Scattergl(
+            x=plot_df.index,
+            y=plot_df['Debt-to-Equity'],
+            mode='lines+markers',
+            name='Debt-to-Equity',
+            line=dict(color='#cc6600', width=3)
+        ), row=2, col=1)
+        
+        fig.update_layout(
+            height=700,
+            barmode='group',
+            legend=_HORIZONTAL_LEGEND
+        )
+        fig.update_yaxes(title_text='Value', row=1, col=1)
+        fig.update_yaxes(title_text='Ratio', row=2, col=1)
+        fig.update_xaxes(title_text='Year', row=2, col=1)
+        
+        figures['balance_sheet'] = fig
+    
+    # Cash flow items
+    if fcf_data:
+        # Convert to DataFrame (oldest first)
+        cf_df = pd.DataFrame({'Free Cash Flow': fcf_data}).sort_index()
+        
+        # Calculate FCF growth rate on the full series, before downsampling
+        cf_df['FCF Growth'] = cf_df['Free Cash Flow'].pct_change()
+        
+        # FCF bars above the FCF growth line, in one figure
+        # (long histories are downsampled)
+        fig = make_subplots(
+            rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.12,
+            subplot_titles=('Free Cash Flow', 'Free Cash Flow Growth')
+        )
+        
+        plot_df = downsample_frame(cf_df, 'Free Cash Flow')
+        fig.add_trace(go.Bar(
+            x=plot_df.index,
+            y=plot_df['Free Cash Flow'],
+            name='Free Cash Flow',
+            marker_color='#0066cc'
+        ), row=1, col=1)
+        
+        # Skip first item as growth is N/A
+        plot_df = downsample_frame(cf_df.iloc[1:], 'FCF Growth')
+        fig.add_trace(go.Scattergl(
+            x=plot_df.index,
+            y=plot_df['FCF Growth'],
+            mode='lines+markers',
+            name='FCF Growth',
+            line=dict(color='#cc6600', width=3)
+        ), row=2, col=1)
+        
+        fig.update_layout(height=700, showlegend=False)
+        fig.update_yaxes(title_text='Value', row=1, col=1)
+        fig.update_yaxes(title_text='Growth Rate', tickformat='.0%', row=2, col=1)
+        fig.update_xaxes(title_text='Year', row=2, col=1)
+        
+        figures['fcf'] = fig
+    
+    # Calculate financial ratios
+    if revenue_data and ebitda_data and net_income_data and assets_data:
+        
+        # Get the most recent data
+        recent_revenue = _most_recent(revenue_data)
+        recent_ebitda = _most_recent(ebitda_data)
+        recent_net_income = _most_recent(net_income_data)
+        recent_assets = _most_recent(assets_data)
+        recent_equity = _most_recent(equity_data)
+        recent_debt = _most_recent(debt_data)
+        recent_fcf = _most_recent(fcf_data)
+        
+        # Calculate ratios
+        ebitda_margin = recent_ebitda / recent_revenue if recent_revenue else 0
+        net_margin = recent_net_income / recent_revenue if recent_revenue else 0
+        roa = recent_net_income / recent_assets if recent_assets else 0
+        roe = recent_net_income / recent_equity if recent_equity else 0
+        debt_to_equity = recent_debt / recent_equity if recent_equity else 0
+        fcf_to_revenue = recent_fcf / recent_revenue if recent_revenue else 0
+        
+        # Create a DataFrame
+        ratios_df = pd.DataFrame({
+            'Ratio': [
+                'EBITDA Margin',
+                'Net Margin',
+                'Return on Assets',
+                'Return on Equity',
+                'Debt-to-Equity',
+                'FCF to Revenue'
+            ],
+            'Value': [
+                f"{ebitda_margin:.2%}",
+                f"{net_margin:.2%}",
+                f"{roa:.2%}",
+                f"{roe:.2%}",
+                f"{debt_to_equity:.2f}",
+                f"{fcf_to_revenue:.2%}"
+            ]
+        })
+        
+        figures['ratios'] = ratios_df
+        
+        # Create a radar chart for the ratios
+        fig = go.Figure()
+        
+        # Normalize ratio values for radar chart
+        ebitda_margin_norm = min(ebitda_margin * 100, 50) / 50  # Cap at 50%
+        net_margin_norm = min(net_margin * 100, 30) / 30  # Cap at 30%
+        roa_norm = min(roa * 100, 20) / 20  # Cap at 20%
+        roe_norm = min(roe * 100, 30) / 30  # Cap at 30%
+        debt_to_equity_norm = 1 - min(debt_to_equity, 2) / 2  # Cap at 2, invert so lower is better
+        fcf_to_revenue_norm = min(fcf_to_revenue * 100, 20) / 20  # Cap at 20%
+        
+        fig.add_trace(go.Scatterpolar(
+            r=[ebitda_margin_norm, net_margin_norm, roa_norm, roe_norm, debt_to_equity_norm, fcf_to_revenue_norm],
+            theta=['EBITDA Margin', 'Net Margin', 'ROA', 'ROE', 'Debt-to-Equity', 'FCF to Revenue'],
+            fill='toself',
+            name=ticker
+        ))
+        
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 1]
+                )
+            ),
+            title="Financial Ratio Profile"
+        )
+        
+        figures['ratio_profile'] = fig
+    
+    return figures
 
 def show():
     """Display the Company Info page"""
@@ -24,14 +467,14 @@ def show():
             with st.spinner("Fetching company information..."):
                 try:
                     # Fetch company information
-                    company_info = DataFetcher.get_company_info(ticker)
+                    company_info = _cached_company_info(ticker)
                     
                     if company_info.get('name', '') == 'N/A':
                         st.error(f"Could not find information for ticker: {ticker}")
                     else:
                         # Display company information
                         display_company_info(ticker, company_info)
-                        
+                
                 except Exception as e:
                     st.error(f"Error fetching company information: {str(e)}")
         else:
@@ -40,23 +483,10 @@ def show():
         # Display sample companies
         st.subheader("Popular Companies")
         
-        sample_companies = [
-            {"ticker": "AAPL", "name": "Apple Inc.", "sector": "Technology"},
-            {"ticker": "MSFT", "name": "Microsoft Corporation", "sector": "Technology"},
-            {"ticker": "AMZN", "name": "Amazon.com, Inc.", "sector": "Consumer Cyclical"},
-            {"ticker": "GOOGL", "name": "Alphabet Inc.", "sector": "Communication Services"},
-            {"ticker": "JNJ", "name": "Johnson & Johnson", "sector": "Healthcare"},
-            {"ticker": "JPM", "name": "JPMorgan Chase & Co.", "sector": "Financial Services"},
-            {"ticker": "PG", "name": "Procter & Gamble Co.", "sector": "Consumer Defensive"},
-            {"ticker": "XOM", "name": "Exxon Mobil Corporation", "sector": "Energy"},
-            {"ticker": "TSLA", "name": "Tesla, Inc.", "sector": "Consumer Cyclical"},
-            {"ticker": "V", "name": "Visa Inc.", "sector": "Financial Services"}
-        ]
-        
         # Create columns for companies
         cols = st.columns(5)
         
-        for i, company in enumerate(sample_companies):
+        for i, company in enumerate(_SAMPLE_COMPANIES):
             col_index = i % 5
             with cols[col_index]:
                 if st.button(f"{company['ticker']}", key=f"sample_{company['ticker']}"):
@@ -65,19 +495,10 @@ def show():
                     st.rerun()
         
         # Display tickers by sector
-        sectors = list(set([company['sector'] for company in sample_companies]))
-        sectors.sort()
-        
-        selected_sector = st.selectbox("Browse by Sector", ["All"] + sectors)
-        
-        if selected_sector != "All":
-            sector_companies = [company for company in sample_companies if company['sector'] == selected_sector]
-        else:
-            sector_companies = sample_companies
+        selected_sector = st.selectbox("Browse by Sector", _SECTORS)
         
-        # Display companies in a table
-        sector_df = pd.DataFrame(sector_companies)
-        st.dataframe(sector_df, use_container_width=True)
+        # Display companies in a static table (no interactive grid needed for a few rows)
+        st.table(_SAMPLE_TABLES[selected_sector])
 
 def display_company_info(ticker, company_info):
     """
@@ -87,6 +508,21 @@ def display_company_info(ticker, company_info):
         ticker (str): Company ticker symbol
         company_info (dict): Company information
     """
+    # Start the remaining fetches together so their network waits overlap;
+    # each section waits only for the data it shows. The executor belongs to
+    # this render, so one session's fetches never queue behind another's.
+    executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='company_info')
+    financial_data_future = _submit_fetch(executor, _cached_financial_data, ticker)
+    esg_future = _submit_fetch(executor, _cached_esg_metrics, ticker)
+    comparables_future = _submit_fetch(
+        executor,
+        _cached_comparable_companies,
+        ticker,
+        company_info.get('industry', '')
+    )
+    # The submitted fetches still run; their threads exit once they finish
+    executor.shutdown(wait=False)
+    
     # Main company header
     st.header(company_info.get('name', ticker))
     
@@ -94,68 +530,56 @@ def display_company_info(ticker, company_info):
     
     with col1:
         st.subheader("Company Overview")
-        st.write(f"**Sector:** {company_info.get('sector', 'N/A')}")
-        st.write(f"**Industry:** {company_info.get('industry', 'N/A')}")
-        st.write(f"**Country:** {company_info.get('country', 'N/A')}")
-        st.write(f"**Employees:** {company_info.get('employees', 'N/A')}")
+        
+        # One markdown element for all the overview lines (one paragraph each)
+        overview_lines = [
+            f"**Sector:** {company_info.get('sector', 'N/A')}",
+            f"**Industry:** {company_info.get('industry', 'N/A')}",
+            f"**Country:** {company_info.get('country', 'N/A')}",
+            f"**Employees:** {company_info.get('employees', 'N/A')}"
+        ]
         if company_info.get('website', 'N/A') != 'N/A':
-            st.write(f"**Website:** [{company_info.get('website')}]({company_info.get('website')})")
+            overview_lines.append(f"**Website:** [{company_info.get('website')}]({company_info.get('website')})")
+        st.markdown("\n\n".join(overview_lines))
+    
+    # Financial data is shared by the market data column and the tabs
+    try:
+        financial_data = financial_data_future.result()
+        financial_data_error = None
+    except Exception as e:
+        print(f"Error fetching financial data for {ticker}: {e}")
+        financial_data = None
+        financial_data_error = e
     
     with col2:
         st.subheader("Market Data")
         
         # Format market cap to billions/millions
-        market_cap = company_info.get('marketCap', 'N/A')
-        if isinstance(market_cap, (int, float)):
-            if market_cap >= 1e9:
-                market_cap_str = f"${market_cap/1e9:.2f}B"
-            elif market_cap >= 1e6:
-                market_cap_str = f"${market_cap/1e6:.2f}M"
-            else:
-                market_cap_str = f"${market_cap:.2f}"
-        else:
-            market_cap_str = market_cap
-        
-        st.write(f"**Market Cap:** {market_cap_str}")
+        st.write(f"**Market Cap:** {format_value(company_info.get('marketCap', 'N/A'))}")
         st.write(f"**Currency:** {company_info.get('currency', 'USD')}")
         
-        # Fetch financial data
         try:
-            financial_data = DataFetcher.get_financial_data(ticker)
+            if financial_data_error is not None:
+                raise financial_data_error
             
             # Get most recent revenue and EBITDA
-            if financial_data.get('revenue', {}):
-                recent_revenue = list(financial_data.get('revenue', {}).values())[0]
-                if isinstance(recent_revenue, (int, float)):
-                    if recent_revenue >= 1e9:
-                        revenue_str = f"${recent_revenue/1e9:.2f}B"
-                    elif recent_revenue >= 1e6:
-                        revenue_str = f"${recent_revenue/1e6:.2f}M"
-                    else:
-                        revenue_str = f"${recent_revenue:.2f}"
-                else:
-                    revenue_str = "N/A"
-                st.write(f"**Revenue (LTM):** {revenue_str}")
+            revenue_data = financial_data.get('revenue', {})
+            ebitda_data = financial_data.get('ebitda', {})
             
-            if financial_data.get('ebitda', {}):
-                recent_ebitda = list(financial_data.get('ebitda', {}).values())[0]
-                if isinstance(recent_ebitda, (int, float)):
-                    if recent_ebitda >= 1e9:
-                        ebitda_str = f"${recent_ebitda/1e9:.2f}B"
-                    elif recent_ebitda >= 1e6:
-                        ebitda_str = f"${recent_ebitda/1e6:.2f}M"
-                    else:
-                        ebitda_str = f"${recent_ebitda:.2f}"
-                else:
-                    ebitda_str = "N/A"
-                st.write(f"**EBITDA (LTM):** {ebitda_str}")
+            if revenue_data:
+                recent_revenue = _most_recent(revenue_data)
+                st.write(f"**Revenue (LTM):** {format_value(recent_revenue, default='N/A')}")
+            
+            if ebitda_data:
+                recent_ebitda = _most_recent(ebitda_data)
+                st.write(f"**EBITDA (LTM):** {format_value(recent_ebitda, default='N/A')}")
         except Exception as e:
             st.write("**Financial Data:** Could not fetch")
     
     with col3:
         # Fetch ESG data
         try:
-            esg_data = DataFetcher.get_esg_metrics(ticker)
+            esg_data = esg_future.result()
             
             st.subheader("ESG Profile")
             
@@ -168,22 +592,12 @@ def display_company_info(ticker, company_info):
                     domain = {'x': [0, 1], 'y': [0, 1]},
                     title = {'text': "ESG Score"},
                     gauge = {
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "#0066cc"},
-                        'steps' : [
-                            {'range': [0, 33], 'color': "#ffcccc"},
-                            {'range': [33, 66], 'color': "#ffffcc"},
-                            {'range': [66, 100], 'color': "#ccffcc"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': esg_score
-                        }
+                        **_ESG_GAUGE_BASE,
+                        'threshold': {**_ESG_GAUGE_THRESHOLD, 'value': esg_score}
                     }
                 ))
                 
-                fig.update_layout(height=200, margin=dict(l=20, r=20, t=30, b=20))
+                fig.update_layout(height=200, margin=_ESG_GAUGE_MARGIN)
                 st.plotly_chart(fig, use_container_width=True)
             else:
                 st.write("**ESG Score:** N/A")
@@ -210,17 +624,20 @@ def display_company_info(ticker, company_info):
                             range=[0, 100]
                         )
                     ),
-                    margin=dict(l=20, r=20, t=20, b=20),
+                    margin=_ESG_RADAR_MARGIN,
                     height=200
                 )
                 
                 st.plotly_chart(fig, use_container_width=True)
             else:
-                st.write(f"**Environmental:** {environmental}")
-                st.write(f"**Social:** {social}")
-                st.write(f"**Governance:** {governance}")
-                
+                st.markdown(
+                    f"**Environmental:** {environmental}\n\n"
+                    f"**Social:** {social}\n\n"
+                    f"**Governance:** {governance}"
+                )
+        
         except Exception as e:
+            print(f"Error fetching ESG data for {ticker}: {e}")
             st.write("**ESG Data:** Could not fetch")
     
     # Business description
@@ -231,317 +648,56 @@ def display_company_info(ticker, company_info):
     st.subheader("Financial Performance")
     
     try:
-        financial_data = DataFetcher.get_financial_data(ticker)
+        if financial_data_error is not None:
+            raise financial_data_error
         
-        tab1, tab2, tab3, tab4 = st.tabs(["Revenue & Profitability", "Balance Sheet", "Cash Flow", "Ratios"])
+        # Empty data from a failed fetch builds no figures, and is kept out of
+        # the per-ticker figure cache so a later successful fetch is charted
+        if any(financial_data.values()):
+            figures = _build_financial_figures(ticker, financial_data)
+        else:
+            figures = {}
         
-        with tab1:
-            # Revenue and EBITDA chart
-            if financial_data.get('revenue', {}) and financial_data.get('ebitda', {}):
-                revenue_data = financial_data.get('revenue', {})
-                ebitda_data = financial_data.get('ebitda', {})
-                
-                # Convert to DataFrame
-                dates = sorted(list(set(list(revenue_data.keys()) + list(ebitda_data.keys()))))
-                fin_df = pd.DataFrame(index=dates)
-                
-                fin_df['Revenue'] = [revenue_data.get(date, None) for date in dates]
-                fin_df['EBITDA'] = [ebitda_data.get(date, None) for date in dates]
-                
-                # Create a bar chart with Plotly
-                fig = go.Figure()
-                
-                fig.add_trace(go.Bar(
-                    x=fin_df.index,
-                    y=fin_df['Revenue'],
-                    name='Revenue',
-                    marker_color='#0066cc'
-                ))
-                
-                fig.add_trace(go.Bar(
-                    x=fin_df.index,
-                    y=fin_df['EBITDA'],
-                    name='EBITDA',
-                    marker_color='#00cc66'
-                ))
-                
-                fig.update_layout(
-                    title='Revenue and EBITDA',
-                    xaxis_title='Year',
-                    yaxis_title='Value',
-                    barmode='group',
-                    legend=dict(
-                        orientation="h",
-                        yanchor="bottom",
-                        y=1.02,
-                        xanchor="right",
-                        x=1
-                    )
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Calculate and display EBITDA margin
-                fin_df['EBITDA Margin'] = fin_df['EBITDA'] / fin_df['Revenue']
-                
-                fig = go.Figure()
-                
-                fig.add_trace(go.Scatter(
-                    x=fin_df.index,
-                    y=fin_df['EBITDA Margin'],
-                    mode='lines+markers',
-                    name='EBITDA Margin',
-                    line=dict(color='#cc6600', width=3)
-                ))
-                
-                fig.update_layout(
-                    title='EBITDA Margin',
-                    xaxis_title='Year',
-                    yaxis_title='Margin',
-                    yaxis_tickformat='.0%'
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+        # Only the selected view is sent to the browser. st.tabs would send
+        # every tab's charts on each rerun, even the hidden ones.
+        view = st.radio(
+            "Financial view",
+            _FINANCIAL_VIEWS,
+            horizontal=True,
+            label_visibility="collapsed",
+            key="company_info_financial_view"
+        )
+        
+        if view == "Revenue & Profitability":
+            if 'revenue_ebitda' in figures:
+                st.plotly_chart(figures['revenue_ebitda'], use_container_width=True)
             else:
                 st.info("No revenue and EBITDA data available.")
             
-            # Net income chart
-            if financial_data.get('net_income', {}):
-                net_income_data = financial_data.get('net_income', {})
-                
-                # Convert to DataFrame
-                dates = sorted(list(net_income_data.keys()))
-                ni_df = pd.DataFrame(index=dates)
-                
-                ni_df['Net Income'] = [net_income_data.get(date, None) for date in dates]
-                
-                # Create a bar chart with Plotly
-                fig = go.Figure()
-                
-                fig.add_trace(go.Bar(
-                    x=ni_df.index,
-                    y=ni_df['Net Income'],
-                    name='Net Income',
-                    marker_color='#0066cc'
-                ))
-                
-                fig.update_layout(
-                    title='Net Income',
-                    xaxis_title='Year',
-                    yaxis_title='Value'
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+            if 'net_income' in figures:
+                st.plotly_chart(figures['net_income'], use_container_width=True)
             else:
                 st.info("No net income data available.")
         
-        with tab2:
-            # Balance sheet items
-            if financial_data.get('total_assets', {}) and financial_data.get('equity', {}):
-                assets_data = financial_data.get('total_assets', {})
-                equity_data = financial_data.get('equity', {})
-                debt_data = financial_data.get('total_debt', {})
-                
-                # Convert to DataFrame
-                dates = sorted(list(set(list(assets_data.keys()) + list(equity_data.keys()) + list(debt_data.keys()))))
-                bs_df = pd.DataFrame(index=dates)
-                
-                bs_df['Total Assets'] = [assets_data.get(date, None) for date in dates]
-                bs_df['Equity'] = [equity_data.get(date, None) for date in dates]
-                bs_df['Debt'] = [debt_data.get(date, None) for date in dates]
-                
-                # Create a bar chart with Plotly
-                fig = go.Figure()
-                
-                fig.add_trace(go.Bar(
-                    x=bs_df.index,
-                    y=bs_df['Total Assets'],
-                    name='Total Assets',
-                    marker_color='#0066cc'
-                ))
-                
-                fig.add_trace(go.Bar(
-                    x=bs_df.index,
-                    y=bs_df['Equity'],
-                    name='Equity',
-                    marker_color='#00cc66'
-                ))
-                
-                fig.add_trace(go.Bar(
-                    x=bs_df.index,
-                    y=bs_df['Debt'],
-                    name='Debt',
-                    marker_color='#cc6600'
-                ))
-                
-                fig.update_layout(
-                    title='Balance Sheet Items',
-                    xaxis_title='Year',
-                    yaxis_title='Value',
-                    barmode='group',
-                    legend=dict(
-                        orientation="h",
-                        yanchor="bottom",
-                        y=1.02,
-                        xanchor="right",
-                        x=1
-                    )
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Calculate and display Debt-to-Equity ratio
-                bs_df['Debt-to-Equity'] = bs_df['Debt'] / bs_df['Equity']
-                
-                fig = go.Figure()
-                
-                fig.add_trace(go.Scatter(
-                    x=bs_df.index,
-                    y=bs_df['Debt-to-Equity'],
-                    mode='lines+markers',
-                    name='Debt-to-Equity',
-                    line=dict(color='#cc6600', width=3)
-                ))
-                
-                fig.update_layout(
-                    title='Debt-to-Equity Ratio',
-                    xaxis_title='Year',
-                    yaxis_title='Ratio'
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+        elif view == "Balance Sheet":
+            if 'balance_sheet' in figures:
+                st.plotly_chart(figures['balance_sheet'], use_container_width=True)
             else:
                 st.info("No balance sheet data available.")
         
-        with tab3:
-            # Cash flow items
-            if financial_data.get('fcf', {}):
-                fcf_data = financial_data.get('fcf', {})
-                
-                # Convert to DataFrame
-                dates = sorted(list(fcf_data.keys()))
-                cf_df = pd.DataFrame(index=dates)
-                
-                cf_df['Free Cash Flow'] = [fcf_data.get(date, None) for date in dates]
-                
-                # Create a bar chart with Plotly
-                fig = go.Figure()
-                
-                fig.add_trace(go.Bar(
-                    x=cf_df.index,
-                    y=cf_df['Free Cash Flow'],
-                    name='Free Cash Flow',
-                    marker_color='#0066cc'
-                ))
-                
-                fig.update_layout(
-                    title='Free Cash Flow',
-                    xaxis_title='Year',
-                    yaxis_title='Value'
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Calculate FCF growth rate
-                cf_df['FCF Growth'] = cf_df['Free Cash Flow'].pct_change()
-                
-                fig = go.Figure()
-                
-                fig.add_trace(go.Scatter(
-                    x=cf_df.index[1:],  # Skip first item as growth is N/A
-                    y=cf_df['FCF Growth'][1:],
-                    mode='lines+markers',
-                    name='FCF Growth',
-                    line=dict(color='#cc6600', width=3)
-                ))
-                
-                fig.update_layout(
-                    title='Free Cash Flow Growth',
-                    xaxis_title='Year',
-                    yaxis_title='Growth Rate',
-                    yaxis_tickformat='.0%'
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+        elif view == "Cash Flow":
+            if 'fcf' in figures:
+                st.plotly_chart(figures['fcf'], use_container_width=True)
             else:
                 st.info("No cash flow data available.")
         
-        with tab4:
-            # Calculate financial ratios
-            if (financial_data.get('revenue', {}) and financial_data.get('ebitda', {}) and 
-                financial_data.get('net_income', {}) and financial_data.get('total_assets', {})):
-                
-                # Get the most recent data
-                recent_revenue = list(financial_data.get('revenue', {}).values())[0]
-                recent_ebitda = list(financial_data.get('ebitda', {}).values())[0]
-                recent_net_income = list(financial_data.get('net_income', {}).values())[0]
-                recent_assets = list(financial_data.get('total_assets', {}).values())[0]
-                recent_equity = list(financial_data.get('equity', {}).values())[0] if financial_data.get('equity', {}) else 0
-                recent_debt = list(financial_data.get('total_debt', {}).values())[0] if financial_data.get('total_debt', {}) else 0
-                recent_fcf = list(financial_data.get('fcf', {}).values())[0] if financial_data.get('fcf', {}) else 0
-                
-                # Calculate ratios
-                ebitda_margin = recent_ebitda / recent_revenue if recent_revenue else 0
-                net_margin = recent_net_income / recent_revenue if recent_revenue else 0
-                roa = recent_net_income / recent_assets if recent_assets else 0
-                roe = recent_net_income / recent_equity if recent_equity else 0
-                debt_to_equity = recent_debt / recent_equity if recent_equity else 0
-                fcf_to_revenue = recent_fcf / recent_revenue if recent_revenue else 0
-                
-                # Create a DataFrame
-                ratios_df = pd.DataFrame({
-                    'Ratio': [
-                        'EBITDA Margin',
-                        'Net Margin',
-                        'Return on Assets',
-                        'Return on Equity',
-                        'Debt-to-Equity',
-                        'FCF to Revenue'
-                    ],
-                    'Value': [
-                        f"{ebitda_margin:.2%}",
-                        f"{net_margin:.2%}",
-                        f"{roa:.2%}",
-                        f"{roe:.2%}",
-                        f"{debt_to_equity:.2f}",
-                        f"{fcf_to_revenue:.2%}"
-                    ]
-                })
-                
-                st.dataframe(ratios_df, use_container_width=True)
-                
-                # Create a radar chart for the ratios
-                fig = go.Figure()
-                
-                # Normalize ratio values for radar chart
-                ebitda_margin_norm = min(ebitda_margin * 100, 50) / 50  # Cap at 50%
-                net_margin_norm = min(net_margin * 100, 30) / 30  # Cap at 30%
-                roa_norm = min(roa * 100, 20) / 20  # Cap at 20%
-                roe_norm = min(roe * 100, 30) / 30  # Cap at 30%
-                debt_to_equity_norm = 1 - min(debt_to_equity, 2) / 2  # Cap at 2, invert so lower is better
-                fcf_to_revenue_norm = min(fcf_to_revenue * 100, 20) / 20  # Cap at 20%
-                
-                fig.add_trace(go.Scatterpolar(
-                    r=[ebitda_margin_norm, net_margin_norm, roa_norm, roe_norm, debt_to_equity_norm, fcf_to_revenue_norm],
-                    theta=['EBITDA Margin', 'Net Margin', 'ROA', 'ROE', 'Debt-to-Equity', 'FCF to Revenue'],
-                    fill='toself',
-                    name=ticker
-                ))
-                
-                fig.update_layout(
-                    polar=dict(
-                        radialaxis=dict(
-                            visible=True,
-                            range=[0, 1]
-                        )
-                    ),
-                    title="Financial Ratio Profile"
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+        else:
+            if 'ratios' in figures:
+                st.table(figures['ratios'])
+                st.plotly_chart(figures['ratio_profile'], use_container_width=True)
             else:
                 st.info("Insufficient data to calculate financial ratios.")
-                
+    
     except Exception as e:
         st.error(f"Error displaying financial data: {str(e)}")
     
@@ -549,49 +705,50 @@ def display_company_info(ticker, company_info):
     st.subheader("Comparable Companies")
     
     try:
-        comparable_companies = DataFetcher.get_comparable_companies(
-            ticker,
-            company_info.get('industry', '')
-        )
+        comparable_companies = comparables_future.result()
         
         if comparable_companies:
-            # Create a DataFrame
-            comps_df = pd.DataFrame([
-                {
-                    'Company': comp.get('name', comp.get('ticker', 'Unknown')),
-                    'Ticker': comp.get('ticker', 'N/A'),
-                    'Market Cap': format_value(comp.get('marketCap', 'N/A')),
-                    'EV/EBITDA': f"{comp.get('ev_ebitda', 'N/A')}x" if isinstance(comp.get('ev_ebitda'), (int, float)) else comp.get('ev_ebitda', 'N/A'),
-                    'P/E': f"{comp.get('pe_ratio', 'N/A')}x" if isinstance(comp.get('pe_ratio'), (int, float)) else comp.get('pe_ratio', 'N/A'),
-                    'EV/Revenue': f"{comp.get('ev_revenue', 'N/A')}x" if isinstance(comp.get('ev_revenue'), (int, float)) else comp.get('ev_revenue', 'N/A')
-                } for comp in comparable_companies
-            ])
+            # Create a DataFrame, one row per company (missing fields become NaN)
+            raw_df = pd.DataFrame(comparable_companies).reindex(
+                columns=['name', 'ticker', 'marketCap', 'ev_ebitda', 'pe_ratio', 'ev_revenue']
+            )
+            
+            # Format whole columns at once
+            comps_df = pd.DataFrame({
+                'Company': raw_df['name'].fillna(raw_df['ticker']).fillna('Unknown'),
+                'Ticker': raw_df['ticker'].fillna('N/A'),
+                'Market Cap': format_values(raw_df['marketCap'].fillna('N/A')),
+                'EV/EBITDA': format_multiples(raw_df['ev_ebitda']),
+                'P/E': format_multiples(raw_df['pe_ratio']),
+                'EV/Revenue': format_multiples(raw_df['ev_revenue'])
+            })
             
             st.dataframe(comps_df, use_container_width=True)
             
             # Create a multiples comparison chart
             if comparable_companies:
-                # Extract data for chart
-                company_names = [comp.get('name', comp.get('ticker', 'Unknown')) for comp in comparable_companies]
-                ev_ebitda_values = [comp.get('ev_ebitda', 0) for comp in comparable_companies]
-                pe_values = [comp.get('pe_ratio', 0) for comp in comparable_companies]
-                ev_revenue_values = [comp.get('ev_revenue', 0) for comp in comparable_companies]
-                
-                # Create DataFrame for plotting
-                df = pd.DataFrame({
-                    'Company': company_names * 3,
-                    'Multiple Type': ['EV/EBITDA'] * len(company_names) + ['P/E'] * len(company_names) + ['EV/Revenue'] * len(company_names),
-                    'Value': ev_ebitda_values + pe_values + ev_revenue_values
+                # Plot the raw multiples in wide form, one column per multiple
+                # (Plotly melts it into one bar group per company). Missing
+                # multiples arrive as NaN or 'N/A' and plot as 0; every column
+                # must be numeric for the wide-form melt.
+                chart_df = pd.DataFrame({
+                    'Company': comps_df['Company'],
+                    'EV/EBITDA': pd.to_numeric(raw_df['ev_ebitda'], errors='coerce').fillna(0),
+                    'P/E': pd.to_numeric(raw_df['pe_ratio'], errors='coerce').fillna(0),
+                    'EV/Revenue': pd.to_numeric(raw_df['ev_revenue'], errors='coerce').fillna(0)
                 })
                 
+                # plotly.express is slow to import and only used here
+                import plotly.express as px
+                
                 # Create the grouped bar chart
                 fig = px.bar(
-                    df, 
+                    chart_df, 
                     x='Company', 
-                    y='Value', 
-                    color='Multiple Type',
+                    y=['EV/EBITDA', 'P/E', 'EV/Revenue'],
                     barmode='group',
                     title='Comparable Company Multiples',
+                    labels={'variable': 'Multiple Type'},
                     color_discrete_map={
                         'EV/EBITDA': '#0066cc',
                         'P/E': '#00cc66',
@@ -602,19 +759,14 @@ def display_company_info(ticker, company_info):
                 fig.update_layout(
                     xaxis_title='',
                     yaxis_title='Multiple Value',
-                    legend=dict(
-                        orientation="h",
-                        yanchor="bottom",
-                        y=1.02,
-                        xanchor="right",
-                        x=1
-                    )
+                    legend=_HORIZONTAL_LEGEND
                 )
                 
                 st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No comparable companies found.")
     except Exception as e:
+        print(f"Error fetching comparable companies for {ticker}: {e}")
         st.error(f"Error displaying comparable companies: {str(e)}")
     
     # Recent news placeholder
@@ -648,14 +800,72 @@ def display_company_info(ticker, company_info):
             st.write(news['summary'])
             st.write("*This is a placeholder news item. In a real application, actual news would be displayed.*")
 
-def format_value(value):
-    """Format value to millions/billions with $ symbol"""
+def format_value(value, default=None):
+    """
+    Format value to millions/billions with $ symbol
+    
+    Args:
+        value: Value to format
+        default: Returned for non-numeric values (the value itself if None)
+    
+    Returns:
+        str: Formatted value
+    """
     if isinstance(value, (int, float)):
-        if value >= 1e9:
-            return f"${value/1e9:.2f}B"
-        elif value >= 1e6:
-            return f"${value/1e6:.2f}M"
-        else:
-            return f"${value:.2f}"
-    return value
+        return _format_number(value)
+    return value if default is None else default
+
+@lru_cache(maxsize=2048)
+def _format_number(value):
+    """
+    Format a number to millions/billions with $ symbol
+    
+    Memoized because the same market caps and financials are formatted on
+    every rerun.
+    
+    Args:
+        value (float): Number to format
+    
+    Returns:
+        str: Formatted value
+    """
+    if value >= 1e9:
+        return f"${value/1e9:.2f}B"
+    elif value >= 1e6:
+        return f"${value/1e6:.2f}M"
+    else:
+        return f"${value:.2f}"
+
+def format_values(values):
+    """
+    Format a Series of values to millions/billions with $ symbol
+    
+    Same output as format_value for each element, with the magnitude
+    selection done on the whole column at once.
+    
+    Args:
+        values (pd.Series): Values to format
+    
+    Returns:
+        pd.Series: Formatted values, non-numeric values left unchanged
+    """
+    numbers = pd.to_numeric(values, errors='coerce')
+    conditions = [numbers >= 1e9, numbers >= 1e6]
+    scaled = pd.Series(np.select(conditions, [numbers / 1e9, numbers / 1e6], default=numbers), index=values.index)
+    suffixes = np.select(conditions, ['B', 'M'], default='')
+    formatted = '$' + scaled.map('{:.2f}'.format) + suffixes
+    return formatted.where(numbers.notna(), values)
+
+def format_multiples(values):
+    """
+    Format a Series of valuation multiples with an x suffix
+    
+    Args:
+        values (pd.Series): Multiples, possibly mixed with placeholders such as 'N/A'
+    
+    Returns:
+        pd.Series: Numeric values as e.g. "12.5x", others unchanged and missing values as 'N/A'
+    """
+    is_number = pd.to_numeric(values, errors='coerce').notna()
+    return (values.astype(str) + 'x').where(is_number, values.fillna('N/A'))
 
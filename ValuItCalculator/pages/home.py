@@ -1,124 +1,180 @@
 import streamlit as st
 
+# Static page content, built once at import rather than on every rerun
+
+# Shared styles for the page's HTML blocks. The stylesheet is part of the hero
+# element, which is sent on every run, so the classes are always defined.
+_HOME_CSS = (
+    "<style>"
+    ".valuit-center{text-align:center}"
+    ".valuit-cta{margin:2rem 0}"
+    ".valuit-grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(20rem,1fr));gap:1rem}"
+    ".valuit-grid-narrow{grid-template-columns:repeat(auto-fit,minmax(14rem,1fr))}"
+    "</style>"
+)
+
+_HERO_TEXT = (
+    "ValuIt is a user-friendly platform that makes company valuation accessible to everyone—"
+    "from students to professionals. Using proven financial techniques, get accurate valuations "
+    "with just a few inputs."
+)
+
+_CALL_TO_ACTION_HTML = (
+    '<div class="valuit-center valuit-cta">'
+    '<h3>Ready to value a company?</h3>'
+    '</div>'
+)
+
+# Styles, subtitle, intro and call to action sent as one markdown element
+_HERO_HTML = _HOME_CSS + "\n\n### Valuation, simplified.\n\n" + _HERO_TEXT + "\n\n" + _CALL_TO_ACTION_HTML
+
+# "How It Works" steps in order, numbered when rendered (two per row)
+_FEATURES = [
+    (
+        "Enter Company Details",
+        [
+            "Enter company name or ticker symbol",
+            "We'll auto-fill financial data when available",
+            "Adjust inputs or use smart defaults"
+        ]
+    ),
+    (
+        "Choose Valuation Methods",
+        [
+            "Discounted Cash Flow (DCF)",
+            "Comparable Company Analysis",
+            "Precedent Transactions",
+            "Asset-Based Valuation",
+            "LBO (Pro mode)"
+        ]
+    ),
+    (
+        "Visualize Results",
+        [
+            "Interactive charts and tables",
+            "Sensitivity analysis",
+            "Compare multiple valuation methods"
+        ]
+    ),
+    (
+        "Save and Share",
+        [
+            "Export to PDF or Excel",
+            "Save valuations to your personal dashboard",
+            "Compare valuations over time"
+        ]
+    ),
+]
+
+_TESTIMONIALS = [
+    ("ValuIt helped me understand company valuation in a way my finance textbooks never could.",
+     "Finance Student"),
+    ("I valued my startup before my pitch meeting and investors were impressed with the thoroughness.",
+     "Startup Founder"),
+    ("The platform's simplicity doesn't compromise on the rigor of the valuation methods.",
+     "Investment Analyst"),
+]
+
+_LEARN_MORE = [
+    (
+        "Valuation Methods Explained",
+        'Visit our <a href="#">Learn</a> section to discover the principles behind each valuation method:',
+        [
+            "How DCF models forecast future cash flows",
+            "When to use comparable company analysis",
+            "Understanding precedent transactions",
+            "Asset-based approaches for stable businesses"
+        ]
+    ),
+    (
+        "ValuIt Pro Features",
+        "Upgrade to Pro for advanced capabilities:",
+        [
+            "Custom WACC and terminal value assumptions",
+            "Scenario and sensitivity analysis",
+            "LBO modeling and analysis",
+            "Detailed projection tables",
+            "Save unlimited valuations"
+        ]
+    ),
+]
+
+# The divider above the footer is part of the footer element
+_FOOTER_HTML = (
+    '<hr>'
+    '<div class="valuit-center">'
+    '<p>© 2023 ValuIt | <a href="#about">About</a> | <a href="#faq">FAQ</a> | '
+    '<a href="#terms">Terms</a> | <a href="#privacy">Privacy</a></p>'
+    '</div>'
+)
+
+def _list_html(items):
+    """Render strings as an HTML bullet list"""
+    return "<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>"
+
+def _grid_html(cells, grid_class="valuit-grid"):
+    """
+    Lay out HTML blocks in a responsive grid
+    
+    Columns wrap onto new rows on narrow screens, the way st.columns stacks.
+    
+    Args:
+        cells (list): HTML for each grid cell, in reading order
+        grid_class (str): CSS classes for the grid, from _HOME_CSS
+    
+    Returns:
+        str: HTML for the grid
+    """
+    return (
+        f'<div class="{grid_class}">'
+        + "".join(f"<div>{cell}</div>" for cell in cells)
+        + "</div>"
+    )
+
+# Each grid is sent as a single markdown element instead of columns of them
+_FEATURES_HTML = _grid_html(
+    [f"<h3>{number}. {heading}</h3>{_list_html(items)}"
+     for number, (heading, items) in enumerate(_FEATURES, 1)]
+)
+
+_TESTIMONIALS_HTML = _grid_html(
+    [f'<blockquote>"{quote}"</blockquote><p><strong>- {author}</strong></p>'
+     for quote, author in _TESTIMONIALS],
+    "valuit-grid valuit-grid-narrow"
+)
+
+_LEARN_MORE_HTML = _grid_html(
+    [f"<h3>{heading}</h3><p>{intro}</p>{_list_html(items)}" for heading, intro, items in _LEARN_MORE]
+)
+
+def _start_valuation():
+    """Switch the navigation to the Valuation Tool (runs before the button's rerun)"""
+    st.session_state['nav_selection'] = "Valuation Tool"
+
 def show():
     """Display the Home page"""
     
     # Hero section
     st.title("ValuIt: Company Valuation Made Simple")
-    st.markdown("### Valuation, simplified.")
     
-    st.write("""
-    ValuIt is a user-friendly platform that makes company valuation accessible to everyone—
-    from students to professionals. Using proven financial techniques, get accurate valuations 
-    with just a few inputs.
-    """)
-    
-    # Call to action
-    st.markdown("""
-    <div style="text-align: center; margin-top: 2rem; margin-bottom: 2rem;">
-        <h3>Ready to value a company?</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    # Subtitle, intro and call to action
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("Start Now", use_container_width=True):
-            st.session_state['nav_selection'] = "Valuation Tool"
-            st.rerun()
+        st.button("Start Now", use_container_width=True, on_click=_start_valuation)
     
     # Features overview
     st.markdown("## How It Works")
-    
-    features_col1, features_col2 = st.columns(2)
-    
-    with features_col1:
-        st.markdown("### 1. Enter Company Details")
-        st.markdown("""
-        - Enter company name or ticker symbol
-        - We'll auto-fill financial data when available
-        - Adjust inputs or use smart defaults
-        """)
-        
-        st.markdown("### 3. Visualize Results")
-        st.markdown("""
-        - Interactive charts and tables
-        - Sensitivity analysis
-        - Compare multiple valuation methods
-        """)
-    
-    with features_col2:
-        st.markdown("### 2. Choose Valuation Methods")
-        st.markdown("""
-        - Discounted Cash Flow (DCF)
-        - Comparable Company Analysis
-        - Precedent Transactions
-        - Asset-Based Valuation
-        - LBO (Pro mode)
-        """)
-        
-        st.markdown("### 4. Save and Share")
-        st.markdown("""
-        - Export to PDF or Excel
-        - Save valuations to your personal dashboard
-        - Compare valuations over time
-        """)
+    st.markdown(_FEATURES_HTML, unsafe_allow_html=True)
     
     # Testimonials
     st.markdown("## What Our Users Say")
-    
-    testimonials_col1, testimonials_col2, testimonials_col3 = st.columns(3)
-    
-    with testimonials_col1:
-        st.markdown("""
-        > "ValuIt helped me understand company valuation in a way my finance textbooks never could."
-        
-        **- Finance Student**
-        """)
-    
-    with testimonials_col2:
-        st.markdown("""
-        > "I valued my startup before my pitch meeting and investors were impressed with the thoroughness."
-        
-        **- Startup Founder**
-        """)
-    
-    with testimonials_col3:
-        st.markdown("""
-        > "The platform's simplicity doesn't compromise on the rigor of the valuation methods."
-        
-        **- Investment Analyst**
-        """)
+    st.markdown(_TESTIMONIALS_HTML, unsafe_allow_html=True)
     
     # Learn more section
     st.markdown("## Learn More About Valuation")
-    
-    learn_col1, learn_col2 = st.columns(2)
-    
-    with learn_col1:
-        st.markdown("### Valuation Methods Explained")
-        st.markdown("""
-        Visit our [Learn](#) section to discover the principles behind each valuation method:
-        - How DCF models forecast future cash flows
-        - When to use comparable company analysis
-        - Understanding precedent transactions
-        - Asset-based approaches for stable businesses
-        """)
-    
-    with learn_col2:
-        st.markdown("### ValuIt Pro Features")
-        st.markdown("""
-        Upgrade to Pro for advanced capabilities:
-        - Custom WACC and terminal value assumptions
-        - Scenario and sensitivity analysis
-        - LBO modeling and analysis
-        - Detailed projection tables
-        - Save unlimited valuations
-        """)
+    st.markdown(_LEARN_MORE_HTML, unsafe_allow_html=True)
     
     # Footer
-    st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center;">
-        <p>© 2023 ValuIt | <a href="#about">About</a> | <a href="#faq">FAQ</a> | <a href="#terms">Terms</a> | <a href="#privacy">Privacy</a></p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
@@ -1,11 +1,80 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
 from datetime import datetime
-import plotly.express as px
 
-from utils.pdf_generator import PDFGenerator
-from utils.excel_generator import ExcelGenerator
+def _format_values(values):
+    """
+    Format amounts in dollars, scaled to millions or billions
+    
+    Entries that are not numbers (e.g. 'N/A') are returned as they are.
+    
+    Args:
+        values (list): Amounts to format
+    
+    Returns:
+        list: Formatted amounts, in the same order
+    """
+    values = np.asarray(values, dtype=object)
+    amounts = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+    
+    # Scale all amounts at once: billions, then millions, otherwise dollars
+    magnitudes = np.abs(amounts)
+    conditions = [magnitudes >= 1e9, magnitudes >= 1e6]
+    scaled = np.select(conditions, [amounts / 1e9, amounts / 1e6], default=amounts)
+    suffixes = np.select(conditions, ["B", "M"], default="")
+    formatted = np.char.add(np.char.add("$", np.char.mod("%.2f", scaled)), suffixes)
+    
+    return np.where(np.isnan(amounts), values, formatted).tolist()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_comparison_figure(company, comparison_rows):
+    """
+    Build the grouped bar chart comparing a company's saved valuations
+    
+    Args:
+        company (str): Company name, used in the chart title
+        comparison_rows (tuple): (timestamp, method, enterprise value, equity value) per valuation
+    
+    Returns:
+        plotly.graph_objects.Figure: The chart, or None if no valuation has both values
+    """
+    comparison_data = []
+    for timestamp, method, enterprise_value, equity_value in comparison_rows:
+        if isinstance(enterprise_value, (int, float)) and isinstance(equity_value, (int, float)):
+            comparison_data.append({
+                'Date': timestamp,
+                'Method': method,
+                'Value Type': 'Enterprise Value',
+                'Value': enterprise_value
+            })
+            comparison_data.append({
+                'Date': timestamp,
+                'Method': method,
+                'Value Type': 'Equity Value',
+                'Value': equity_value
+            })
+    
+    if not comparison_data:
+        return None
+    
+    df = pd.DataFrame(comparison_data)
+    
+    # plotly.express is slow to import and only used here
+    import plotly.express as px
+    
+    # Create a grouped bar chart
+    return px.bar(
+        df,
+        x='Date',
+        y='Value',
+        color='Value Type',
+        barmode='group',
+        title=f'Valuation Comparison for {company}',
+        labels={'Value': 'Value ($)', 'Date': ''},
+        hover_data=['Method']
+    )
 
 def show():
     """Display the My Valuations page"""
@@ -25,31 +94,17 @@ def show():
     if not st.session_state.valuations:
         st.info("You haven't saved any valuations yet. Use the Valuation Tool to create and save valuations.")
     else:
-        # Create a dataframe of saved valuations for display
-        valuations_data = []
-        for val in st.session_state.valuations:
+        # Create a dataframe of saved valuations for display, one column at a time
+        valuations = st.session_state.valuations
+        valuations_data = {
+            'ID': [val.get('id', '') for val in valuations],
+            'Company': [val.get('company', 'Unknown') for val in valuations],
+            'Method': [val.get('method', '') for val in valuations],
             # Format values to millions or billions
-            def format_value(value):
-                if isinstance(value, (int, float)):
-                    if abs(value) >= 1e9:
-                        return f"${value/1e9:.2f}B"
-                    elif abs(value) >= 1e6:
-                        return f"${value/1e6:.2f}M"
-                    else:
-                        return f"${value:.2f}"
-                return value
-            
-            enterprise_value = format_value(val.get('enterprise_value', 'N/A'))
-            equity_value = format_value(val.get('equity_value', 'N/A'))
-            
-            valuations_data.append({
-                'ID': val.get('id', ''),
-                'Company': val.get('company', 'Unknown'),
-                'Method': val.get('method', ''),
-                'Enterprise Value': enterprise_value,
-                'Equity Value': equity_value,
-                'Date': val.get('timestamp', '')
-            })
+            'Enterprise Value': _format_values([val.get('enterprise_value', 'N/A') for val in valuations]),
+            'Equity Value': _format_values([val.get('equity_value', 'N/A') for val in valuations]),
+            'Date': [val.get('timestamp', '') for val in valuations]
+        }
         
         # Display valuations in a table
         df = pd.DataFrame(valuations_data)
@@ -58,26 +113,27 @@ def show():
         # Valuation details and actions
         st.subheader("Valuation Details")
         
-        # Select a valuation to view
-        valuation_ids = [val.get('id', '') for val in st.session_state.valuations]
-        valuation_names = [f"{val.get('company', 'Unknown')} - {val.get('method', '')} ({val.get('timestamp', '')})" for val in st.session_state.valuations]
+        # Select a valuation to view. The options are positions in the list, so the
+        # selection maps straight back to its valuation without searching the labels.
+        valuation_names = [f"{val.get('company', 'Unknown')} - {val.get('method', '')} ({val.get('timestamp', '')})" for val in valuations]
         
         selected_index = 0
         if 'current_valuation' in st.session_state and st.session_state.current_valuation:
-            try:
-                selected_index = valuation_ids.index(st.session_state.current_valuation.get('id', ''))
-            except:
-                selected_index = 0
+            current_id = st.session_state.current_valuation.get('id', '')
+            selected_index = next(
+                (i for i, val in enumerate(valuations) if val.get('id', '') == current_id),
+                0
+            )
         
-        selected_valuation = st.selectbox(
+        selected_index = st.selectbox(
             "Select a valuation to view",
-            options=valuation_names,
-            index=selected_index
+            options=range(len(valuations)),
+            index=selected_index,
+            format_func=valuation_names.__getitem__
         )
         
         # Get the selected valuation data
-        selected_index = valuation_names.index(selected_valuation)
-        selected_valuation_data = st.session_state.valuations[selected_index]
+        selected_valuation_data = valuations[selected_index]
         
         # Store the current valuation for reference
         st.session_state.current_valuation = selected_valuation_data
@@ -92,8 +148,12 @@ def show():
                 st.write(f"**Date:** {selected_valuation_data.get('timestamp', '')}")
             
             with col2:
-                st.write(f"**Enterprise Value:** {format_value(selected_valuation_data.get('enterprise_value', 'N/A'))}")
-                st.write(f"**Equity Value:** {format_value(selected_valuation_data.get('equity_value', 'N/A'))}")
+                enterprise_value, equity_value = _format_values([
+                    selected_valuation_data.get('enterprise_value', 'N/A'),
+                    selected_valuation_data.get('equity_value', 'N/A')
+                ])
+                st.write(f"**Enterprise Value:** {enterprise_value}")
+                st.write(f"**Equity Value:** {equity_value}")
             
             with col3:
                 st.write("**Actions:**")
@@ -110,6 +170,9 @@ def show():
                             'sector': 'N/A'  # This might be stored elsewhere in a real app
                         }
                         
+                        # The report libraries are only loaded when a report is requested
+                        from utils.pdf_generator import PDFGenerator
+                        
                         pdf_data = PDFGenerator.generate_valuation_report(
                             valuation_data=valuation_data,
                             company_info=company_info
@@ -138,6 +201,8 @@ def show():
                             'sector': 'N/A'  # This might be stored elsewhere in a real app
                         }
                         
+                        from utils.excel_generator import ExcelGenerator
+                        
                         excel_data = ExcelGenerator.generate_valuation_excel(
                             valuation_data=valuation_data,
                             company_info=company_info
@@ -165,43 +230,15 @@ def show():
                 with st.expander("Valuation Comparison", expanded=True):
                     st.write(f"### Comparing Valuations for {company}")
                     
-                    # Create comparison chart
-                    comparison_data = []
-                    for val in same_company_valuations:
-                        enterprise_value = val.get('enterprise_value', 0)
-                        equity_value = val.get('equity_value', 0)
-                        timestamp = val.get('timestamp', '')
-                        method = val.get('method', '')
-                        
-                        if isinstance(enterprise_value, (int, float)) and isinstance(equity_value, (int, float)):
-                            comparison_data.append({
-                                'Date': timestamp,
-                                'Method': method,
-                                'Value Type': 'Enterprise Value',
-                                'Value': enterprise_value
-                            })
-                            comparison_data.append({
-                                'Date': timestamp,
-                                'Method': method,
-                                'Value Type': 'Equity Value',
-                                'Value': equity_value
-                            })
+                    # Create comparison chart (rebuilt only when these valuations change)
+                    comparison_rows = tuple(
+                        (val.get('timestamp', ''), val.get('method', ''),
+                         val.get('enterprise_value', 0), val.get('equity_value', 0))
+                        for val in same_company_valuations
+                    )
+                    fig = _build_comparison_figure(company, comparison_rows)
                     
-                    if comparison_data:
-                        df = pd.DataFrame(comparison_data)
-                        
-                        # Create a grouped bar chart
-                        fig = px.bar(
-                            df,
-                            x='Date',
-                            y='Value',
-                            color='Value Type',
-                            barmode='group',
-                            title=f'Valuation Comparison for {company}',
-                            labels={'Value': 'Value ($)', 'Date': ''},
-                            hover_data=['Method']
-                        )
-                        
+                    if fig is not None:
                         st.plotly_chart(fig, use_container_width=True)
         
         # Delete valuation option
@@ -1,3 +1,4 @@
+import math
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -403,7 +404,8 @@ def show():
             discounted_terminal_value = terminal_value / ((1 + wacc) ** forecast_years)
             
             # Calculate enterprise value
-            enterprise_value = sum(present_values) + discounted_terminal_value
+            pv_fcf_total = math.fsum(present_values)
+            enterprise_value = pv_fcf_total + discounted_terminal_value
             
             # Format values to millions
             def format_millions(value):
@@ -417,7 +419,7 @@ def show():
             with col1:
                 st.write(f"WACC: {wacc*100:.2f}%")
                 st.write(f"Terminal Growth Rate: {terminal_growth_rate*100:.2f}%")
-                st.write(f"Sum of PV of FCF: {format_millions(sum(present_values))}")
+                st.write(f"Sum of PV of FCF: {format_millions(pv_fcf_total)}")
                 
             with col2:
                 st.write(f"Terminal Value: {format_millions(terminal_value)}")
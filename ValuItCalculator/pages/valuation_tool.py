@@ -1,3 +1,4 @@
+import math
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -506,7 +507,7 @@ def display_valuation_results(results, company_info):
             
             with col2:
                 st.write("**Valuation Components**")
-                st.write(f"Sum of PV of FCF: {format_value(sum(present_values))}")
+                st.write(f"Sum of PV of FCF: {format_value(math.fsum(present_values))}")
                 st.write(f"Terminal Value: {format_value(dcf_details.get('terminal_value', 'N/A'))}")
                 st.write(f"PV of Terminal Value: {format_value(dcf_details.get('pv_terminal_value', 'N/A'))}")
                 st.write(f"Enterprise Value: {format_value(results.get('enterprise_value', 'N/A'))}")
@@ -3,6 +3,15 @@ import numpy as np
 import requests
 import yfinance as yf
 import time
+import threading
+from collections import OrderedDict
+
+# Comparable company lookups are reused for this many seconds before refetching
+COMPARABLES_TTL_SECONDS = 3600
+MAX_CACHED_COMPARABLES = 512
+
+_comparables = OrderedDict()
+_comparables_lock = threading.Lock()
 
 class DataFetcher:
     """Utility class to fetch financial data from various sources"""
@@ -471,6 +480,45 @@ class DataFetcher:
         """
         Fetch list of comparable companies based on ticker and industry
         
+        Results are cached per (ticker, industry) for COMPARABLES_TTL_SECONDS,
+        so repeated valuations of the same company do not refetch its peers.
+        
+        Args:
+            ticker (str): Company ticker symbol
+            industry (str): Industry name
+            
+        Returns:
+            list: List of comparable companies with metrics
+        """
+        key = (ticker, industry)
+        now = time.monotonic()
+        
+        with _comparables_lock:
+            cached = _comparables.get(key)
+            if cached is not None and now - cached[0] < COMPARABLES_TTL_SECONDS:
+                _comparables.move_to_end(key)
+                peer_data = cached[1]
+            else:
+                peer_data = None
+        
+        if peer_data is None:
+            peer_data = tuple(DataFetcher._fetch_comparable_companies(ticker, industry))
+            # Failed lookups return no peers and are retried on the next call
+            if peer_data:
+                with _comparables_lock:
+                    _comparables[key] = (now, peer_data)
+                    _comparables.move_to_end(key)
+                    if len(_comparables) > MAX_CACHED_COMPARABLES:
+                        _comparables.popitem(last=False)
+        
+        # Callers may modify the peer dicts, so hand out copies
+        return [dict(peer) for peer in peer_data]
+    
+    @staticmethod
+    def _fetch_comparable_companies(ticker, industry):
+        """
+        Fetch list of comparable companies based on ticker and industry
+        
         Args:
             ticker (str): Company ticker symbol
             industry (str): Industry name
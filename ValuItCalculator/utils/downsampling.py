@@ -0,0 +1,67 @@
+import numpy as np
+
+# Series longer than this are downsampled before they are sent to the browser
+MAX_CHART_POINTS = 500
+
+def lttb_indices(values, max_points=MAX_CHART_POINTS):
+    """
+    Select the points of a series to keep using Largest-Triangle-Three-Buckets
+    
+    The first and last points are always kept. The points in between are split
+    into buckets, and each bucket keeps the point forming the largest triangle
+    with the previously kept point and the average of the next bucket, which
+    preserves the visual shape (peaks and troughs) of the series.
+    
+    Args:
+        values (array-like): Series values, assumed evenly spaced
+        max_points (int): Maximum number of points to keep
+    
+    Returns:
+        np.ndarray: Positions of the points to keep, in increasing order
+    """
+    n = len(values)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    
+    # Missing values do not take part in the selection
+    y = np.nan_to_num(np.asarray(values, dtype=float))
+    x = np.arange(n, dtype=float)
+    
+    # Bucket boundaries between the fixed first and last points
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    
+    selected = [0]
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        
+        # Average of the next bucket (the last point for the final bucket)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Twice the triangle area for every candidate in the bucket
+        prev = selected[-1]
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        selected.append(start + int(np.argmax(area)))
+    
+    selected.append(n - 1)
+    return np.array(selected)
+
+def downsample_frame(df, column, max_points=MAX_CHART_POINTS):
+    """
+    Downsample a DataFrame for plotting, choosing rows by one column's shape
+    
+    Args:
+        df (pd.DataFrame): Data to plot, in plotting order
+        column (str): Column whose shape decides which rows are kept
+        max_points (int): Maximum number of rows to keep
+    
+    Returns:
+        pd.DataFrame: The DataFrame itself if short enough, otherwise the kept rows
+    """
+    if len(df) <= max_points:
+        return df
+    return df.iloc[lttb_indices(df[column].to_numpy(), max_points)]
@@ -1,3 +1,4 @@
+import math
 import numpy as np
 import pandas as pd
 
@@ -96,7 +97,7 @@ class FinancialCalculations:
         discounted_terminal_value = terminal_value / ((1 + discount_rate) ** final_year)
         
         # Enterprise value is sum of PV of FCFs and discounted terminal value
-        enterprise_value = sum(pv_fcf) + discounted_terminal_value
+        enterprise_value = math.fsum(pv_fcf) + discounted_terminal_value
         
         return enterprise_value
     